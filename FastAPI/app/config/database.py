@@ -1,10 +1,14 @@
 """
 This module configures and manages the database connection using Peewee ORM.
+
+The models are bound to a ``DatabaseProxy``; the actual database is created
+by ``init_database`` when the application is built, so that importing this
+module does not need any configuration and tests can use SQLite.
 """
 
-import os
-from dotenv import load_dotenv
 from peewee import (
+    Database,
+    DatabaseProxy,
     Model,
     MySQLDatabase,
     AutoField,
@@ -13,18 +17,37 @@ from peewee import (
     ForeignKeyField,
     DateTimeField,  # type: ignore
 )
+from playhouse.db_url import connect
+from config.settings import Settings
 
-# Load environment variables from a .env file
-load_dotenv()
+# Placeholder for the database connection, initialised by init_database
+database = DatabaseProxy()
 
-# Configure the MySQL database connection
-database = MySQLDatabase(
-    os.getenv("MYSQL_DATABASE"),
-    user=os.getenv("MYSQL_USER"),
-    passwd=os.getenv("MYSQL_PASSWORD"),
-    host=os.getenv("MYSQL_HOST"),
-    port=int(os.getenv("MYSQL_PORT")),
-)
+
+def init_database(settings: Settings) -> Database:
+    """
+    Create the database described by the settings and bind the models to it.
+
+    No connection is opened until the database is first used.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        Database: The database the models are now bound to.
+    """
+    if settings.database_url:
+        target = connect(settings.database_url)
+    else:
+        target = MySQLDatabase(
+            settings.mysql_database,
+            user=settings.mysql_user,
+            passwd=settings.mysql_password,
+            host=settings.mysql_host,
+            port=settings.mysql_port,
+        )
+    database.initialize(target)
+    return target
 
 
 # pylint: disable=too-few-public-methods
@@ -47,7 +70,7 @@ class AuthorModel(Model):
         Meta class for the 'author' table in the database.
 
         Attributes:
-            database (MySQLDatabase): The database connection used by the model.
+            database (DatabaseProxy): The database connection used by the model.
             table_name (str): The name of the table in the database.
         """
 
@@ -78,10 +101,9 @@ class ArticleModel(Model):
         Meta configuration for the ArticleModel.
 
         Attributes:
-            database (MySQLDatabase): The database connection used by the model.
+            database (DatabaseProxy): The database connection used by the model.
             table_name (str): The name of the table in the database.
         """
 
         database = database
         table_name = "article"
-
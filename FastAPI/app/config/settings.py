@@ -0,0 +1,142 @@
+"""
+This module defines the typed application settings, loaded once from the
+environment and the optional .env file.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return float(value)
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings.
+
+    Attributes:
+        database_url (str, optional): Database URL such as ``sqlite:///app.db``.
+            When set it replaces the ``mysql_*`` settings.
+        mysql_database (str, optional): Name of the MySQL database.
+        mysql_user (str, optional): MySQL user.
+        mysql_password (str, optional): MySQL password.
+        mysql_host (str, optional): MySQL host.
+        mysql_port (int): MySQL port.
+        db_connections_per_worker (int, optional): Maximum number of database
+            connections one server process may open.
+        api_key (str, optional): Legacy single API key.
+        api_keys (str): Registered API keys, see ``helpers.api_key_auth``.
+        rate_limit_rate (float): Default requests per second per API key.
+        rate_limit_burst (int): Default burst size per API key.
+        rate_limit_redis_url (str, optional): Redis URL shared by all workers.
+        article_write_behind (bool): Whether article creation is batched.
+        article_batch_size (int): Maximum number of articles per batch.
+        article_batch_max_delay_ms (float): Maximum wait for a batch to fill up.
+        article_queue_size (int): Maximum number of queued articles.
+        article_write_behind_durability (str): ``"commit"`` or ``"enqueue"``.
+        article_write_behind_drain_timeout (float): Seconds allowed on shutdown
+            to flush the queued articles.
+        warm_up (bool): Whether to open database connections and fill the
+            application caches on startup.
+        warm_up_connections (int): Threadpool connections opened by the warm-up.
+    """
+
+    database_url: Optional[str] = None
+    mysql_database: Optional[str] = None
+    mysql_user: Optional[str] = None
+    mysql_password: Optional[str] = None
+    mysql_host: Optional[str] = None
+    mysql_port: int = 3306
+    db_connections_per_worker: Optional[int] = None
+    api_key: Optional[str] = None
+    api_keys: str = ""
+    rate_limit_rate: float = 10.0
+    rate_limit_burst: int = 20
+    rate_limit_redis_url: Optional[str] = None
+    article_write_behind: bool = False
+    article_batch_size: int = 100
+    article_batch_max_delay_ms: float = 10.0
+    article_queue_size: int = 10000
+    article_write_behind_durability: str = "commit"
+    article_write_behind_drain_timeout: float = 10.0
+    warm_up: bool = False
+    warm_up_connections: int = 4
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build the settings from the environment, after loading the .env file.
+
+        Returns:
+            Settings: The settings.
+
+        Raises:
+            ValueError: If a numeric variable cannot be parsed.
+        """
+        load_dotenv()
+        return cls(
+            database_url=os.getenv("DATABASE_URL") or None,
+            mysql_database=os.getenv("MYSQL_DATABASE"),
+            mysql_user=os.getenv("MYSQL_USER"),
+            mysql_password=os.getenv("MYSQL_PASSWORD"),
+            mysql_host=os.getenv("MYSQL_HOST"),
+            mysql_port=_env_int("MYSQL_PORT", 3306),
+            db_connections_per_worker=_env_int("DB_CONNECTIONS_PER_WORKER", None),
+            api_key=os.getenv("API_KEY") or None,
+            api_keys=os.getenv("API_KEYS", ""),
+            rate_limit_rate=_env_float("RATE_LIMIT_RATE", 10.0),
+            rate_limit_burst=_env_int("RATE_LIMIT_BURST", 20),
+            rate_limit_redis_url=os.getenv("RATE_LIMIT_REDIS_URL") or None,
+            article_write_behind=_env_bool("ARTICLE_WRITE_BEHIND"),
+            article_batch_size=_env_int("ARTICLE_BATCH_SIZE", 100),
+            article_batch_max_delay_ms=_env_float("ARTICLE_BATCH_MAX_DELAY_MS", 10.0),
+            article_queue_size=_env_int("ARTICLE_QUEUE_SIZE", 10000),
+            article_write_behind_durability=os.getenv("ARTICLE_WRITE_BEHIND_DURABILITY", "commit"),
+            article_write_behind_drain_timeout=_env_float(
+                "ARTICLE_WRITE_BEHIND_DRAIN_TIMEOUT", 10.0
+            ),
+            warm_up=_env_bool("WARM_UP"),
+            warm_up_connections=_env_int("WARM_UP_CONNECTIONS", 4),
+        )
+
+    @property
+    def db_connections_required(self) -> int:
+        """
+        Returns:
+            int: Database connections one server process needs at least: one
+            for the event loop thread, one for the write-behind writer when
+            batching is enabled and one for the threadpool.
+        """
+        return 3 if self.article_write_behind else 2
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns:
+        Settings: The settings loaded from the environment, read only once.
+    """
+    return Settings.from_env()
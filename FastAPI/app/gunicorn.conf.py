@@ -0,0 +1,88 @@
+"""
+gunicorn.conf.py
+
+Production server configuration: several uvicorn worker processes managed by
+gunicorn.
+
+The application is imported once in the master process (``preload_app``)
+and forked into ``WEB_CONCURRENCY`` workers. ``DB_CONNECTION_BUDGET`` is the
+total number of database connections the deployment may open; it is split
+evenly between the workers through ``DB_CONNECTIONS_PER_WORKER``.
+
+Send ``HUP`` to the master to gracefully replace the workers. Because the
+code is preloaded, deploying new code requires ``USR2`` (start a new master)
+followed by ``TERM`` on the old one.
+"""
+
+# pylint: disable=invalid-name
+
+import logging
+import os
+import time
+from dotenv import load_dotenv
+from config.settings import Settings
+
+# Load environment variables from a .env file, as the application does
+load_dotenv()
+
+logger = logging.getLogger("gunicorn.error")
+
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+worker_class = "uvicorn_worker.UvicornWorker"
+bind = f"0.0.0.0:{os.getenv('PORT', '80')}"
+preload_app = True
+timeout = int(os.getenv("WORKER_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+DB_CONNECTION_BUDGET = os.getenv("DB_CONNECTION_BUDGET")
+if DB_CONNECTION_BUDGET:
+    _per_worker = int(DB_CONNECTION_BUDGET) // workers
+    _required = Settings.from_env().db_connections_required
+    if _per_worker < _required:
+        raise RuntimeError(
+            f"DB_CONNECTION_BUDGET={DB_CONNECTION_BUDGET} gives {_per_worker} connections to "
+            f"each of the {workers} workers, but a worker needs {_required}"
+        )
+    os.environ["DB_CONNECTIONS_PER_WORKER"] = str(_per_worker)
+
+_started_at = time.perf_counter()
+
+
+def rss_mb() -> float:
+    """
+    Resident memory of the current process.
+
+    Returns:
+        float: The resident set size in megabytes, or 0 if unavailable.
+    """
+    try:
+        with open("/proc/self/status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def when_ready(_server):
+    """
+    Report the master startup time, including the application preload.
+    """
+    logger.info(
+        "Master ready in %.2fs with %d workers (%s DB connections each), RSS %.1f MB",
+        time.perf_counter() - _started_at,
+        workers,
+        os.getenv("DB_CONNECTIONS_PER_WORKER", "unlimited"),
+        rss_mb(),
+    )
+
+
+def post_worker_init(worker):
+    """
+    Report the memory of each worker once it has been forked and initialised.
+    """
+    logger.info("Worker %s ready, RSS %.1f MB", worker.pid, rss_mb())
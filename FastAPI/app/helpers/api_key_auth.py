@@ -2,39 +2,105 @@
 api_key_auth.py
 
 This module provides functionality to handle API key authentication using FastAPI.
+
+Keys are configured in ``API_KEYS`` as a comma separated list of
+``name:sha256_hex[:rate[:burst]]`` entries, where ``sha256_hex`` is the
+SHA-256 digest of the key. The legacy ``API_KEY`` variable is still
+accepted and registered under the name ``default``.
 """
 
-import os
-from dotenv import load_dotenv
-from fastapi import HTTPException, Security, status
+import hashlib
+import math
+from dataclasses import dataclass
+from fastapi import HTTPException, Request, Security, status
 from fastapi.security.api_key import APIKeyHeader
+from config.settings import Settings
 
-# Load environment variables from a .env file
-load_dotenv()
-
-API_KEY = os.getenv("API_KEY")
 API_KEY_NAME = "x-api-key"
 
 # Create an API key header instance for security
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
 
-async def get_api_key(api_key: str = Security(api_key_header)):
+@dataclass(frozen=True)
+class ApiKeyEntry:
+    """
+    Registered API key.
+
+    Attributes:
+        name (str): Name identifying the caller.
+        key_hash (bytes): SHA-256 digest of the key.
+        rate (float): Requests allowed per second.
+        burst (int): Maximum number of requests allowed in a burst.
+    """
+
+    name: str
+    key_hash: bytes
+    rate: float
+    burst: int
+
+
+def hash_api_key(api_key: str) -> bytes:
     """
-    Retrieve and validate the API key from the request header.
+    Hash an API key.
 
     Args:
-        api_key (str): The API key provided in the request header.
+        api_key (str): The API key in plain text.
+
+    Returns:
+        bytes: The SHA-256 digest of the key.
+    """
+    return hashlib.sha256(api_key.encode()).digest()
+
+
+def load_api_keys(settings: Settings) -> dict:
+    """
+    Load the key registry from the settings.
+
+    Args:
+        settings (Settings): The application settings.
 
     Returns:
-        str: The valid API key if it matches the expected value.
+        dict: Registered keys indexed by their SHA-256 digest.
 
     Raises:
-        HTTPException: If the API key is invalid or missing.
+        ValueError: If an ``API_KEYS`` entry is malformed, its digest is not
+            32 bytes long, or its name is already used. The legacy ``API_KEY``
+            is registered under the name ``default``.
     """
-    if api_key == API_KEY:
-        return api_key
-    raise HTTPException(
+    rate, burst = settings.rate_limit_rate, settings.rate_limit_burst
+    registry = {}
+    names = set()
+    if settings.api_key:
+        key_hash = hash_api_key(settings.api_key)
+        registry[key_hash] = ApiKeyEntry("default", key_hash, rate, burst)
+        names.add("default")
+    for raw_entry in filter(None, (item.strip() for item in settings.api_keys.split(","))):
+        parts = raw_entry.split(":")
+        name = parts[0]
+        try:
+            if not 2 <= len(parts) <= 4:
+                raise ValueError("expected name:sha256_hex[:rate[:burst]]")
+            key_hash = bytes.fromhex(parts[1])
+            if len(key_hash) != hashlib.sha256().digest_size:
+                raise ValueError("the digest must be 32 bytes long")
+            if name in names:
+                raise ValueError("the name is already used")
+            entry = ApiKeyEntry(
+                name,
+                key_hash,
+                float(parts[2]) if len(parts) > 2 else rate,
+                int(parts[3]) if len(parts) > 3 else burst,
+            )
+        except ValueError as exc:
+            raise ValueError(f"Invalid API_KEYS entry: {name}") from exc
+        names.add(name)
+        registry[key_hash] = entry
+    return registry
+
+
+def _forbidden() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
         detail={
             "status": False,
@@ -42,3 +108,42 @@ async def get_api_key(api_key: str = Security(api_key_header)):
             "message": "Unauthorized",
         },
     )
+
+
+async def get_api_key(request: Request, api_key: str = Security(api_key_header)):
+    """
+    Retrieve and validate the API key from the request header and apply
+    the rate limit of the matching key.
+
+    The key registry and the rate limiter are read from ``app.state``,
+    where ``create_app`` stores them.
+
+    Args:
+        request (Request): The incoming request.
+        api_key (str): The API key provided in the request header.
+
+    Returns:
+        str: The valid API key if it matches a registered key.
+
+    Raises:
+        HTTPException: If the API key is invalid or missing (403), or if the
+            key has exceeded its rate limit (429).
+    """
+    if not api_key:
+        raise _forbidden()
+    entry = request.app.state.api_key_registry.get(hash_api_key(api_key))
+    if entry is None:
+        raise _forbidden()
+
+    retry_after = await request.app.state.rate_limiter.hit(entry.name, entry.rate, entry.burst)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "status": False,
+                "status_code": status.HTTP_429_TOO_MANY_REQUESTS,
+                "message": "Too many requests",
+            },
+            headers={"Retry-After": str(max(1, math.ceil(min(retry_after, 86400))))},
+        )
+    return api_key
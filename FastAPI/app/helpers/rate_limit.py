@@ -0,0 +1,162 @@
+"""
+rate_limit.py
+
+This module provides token-bucket rate limiting for API keys.
+
+Buckets live in process memory by default. Deployments running several
+workers can point ``RATE_LIMIT_REDIS_URL`` at a Redis server so that all
+workers share the same buckets.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket holding the remaining request allowance of one API key.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens the bucket can hold.
+        tokens (float): Tokens currently available.
+        updated_at (float): Monotonic time of the last refill.
+        lock (threading.Lock): Lock guarding this bucket only.
+    """
+
+    rate: float
+    burst: int
+    tokens: float = -1.0
+    updated_at: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        if self.tokens < 0:
+            self.tokens = float(self.burst)
+
+    def consume(self) -> float:
+        """
+        Take one token from the bucket.
+
+        Returns:
+            float: 0 if the request is allowed, otherwise the number of
+            seconds until a token becomes available.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            if self.rate <= 0:
+                return float("inf")
+            return (1 - self.tokens) / self.rate
+
+
+# pylint: disable=too-few-public-methods
+class InMemoryRateLimiter:
+    """
+    Rate limiter keeping one token bucket per key in process memory.
+
+    The registry lock is only taken the first time a key is seen; after
+    that each request only locks its own bucket.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, rate: float, burst: int) -> float:
+        """
+        Register a request for the given key.
+
+        Args:
+            key (str): Identifier of the caller.
+            rate (float): Tokens added per second.
+            burst (int): Maximum number of tokens the bucket can hold.
+
+        Returns:
+            float: 0 if the request is allowed, otherwise the retry delay in seconds.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(rate=rate, burst=burst))
+        return bucket.consume()
+
+
+class RedisRateLimiter:
+    """
+    Rate limiter storing token buckets in Redis so that several worker
+    processes share the same limits.
+
+    The refill and consume steps run atomically inside a Lua script, sent
+    through the asyncio Redis client so the event loop is never blocked.
+    """
+
+    SCRIPT = """
+    local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local rate = tonumber(ARGV[1])
+    local burst = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local tokens = tonumber(data[1]) or burst
+    local ts = tonumber(data[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+    local wait = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    elseif rate > 0 then
+        wait = (1 - tokens) / rate
+    else
+        wait = -1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    if rate > 0 then
+        redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    end
+    return tostring(wait)
+    """
+
+    def __init__(self, url: str):
+        # pylint: disable=import-outside-toplevel
+        from redis import asyncio as redis  # type: ignore
+
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def hit(self, key: str, rate: float, burst: int) -> float:
+        """
+        Register a request for the given key.
+
+        Args:
+            key (str): Identifier of the caller.
+            rate (float): Tokens added per second.
+            burst (int): Maximum number of tokens the bucket can hold.
+
+        Returns:
+            float: 0 if the request is allowed, otherwise the retry delay in seconds.
+        """
+        wait = float(
+            await self._script(keys=[f"rate_limit:{key}"], args=[rate, burst, time.time()])
+        )
+        return float("inf") if wait < 0 else wait
+
+
+def build_rate_limiter(redis_url: Optional[str] = None):
+    """
+    Build a rate limiter.
+
+    Args:
+        redis_url (str, optional): URL of the Redis server shared by the workers.
+
+    Returns:
+        RedisRateLimiter | InMemoryRateLimiter: A shared Redis limiter when
+        ``redis_url`` is set, otherwise an in-process one.
+    """
+    if redis_url:
+        return RedisRateLimiter(redis_url)
+    return InMemoryRateLimiter()
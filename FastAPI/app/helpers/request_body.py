@@ -0,0 +1,41 @@
+"""
+request_body.py
+
+This module exposes the body of a request as a blocking binary stream, so
+that synchronous parsers running in the threadpool can read an upload while
+it is still arriving, without buffering it whole.
+"""
+
+import io
+from typing import AsyncIterator
+from anyio import from_thread
+
+
+class RequestBodyReader(io.RawIOBase):
+    """
+    Raw binary stream reading the chunks of an asynchronous request body.
+
+    It must be read from a worker thread started by ``anyio.to_thread``
+    (``run_in_threadpool``): each read waits on the event loop for the next
+    chunk. Wrap it in ``io.BufferedReader`` to iterate over lines.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        super().__init__()
+        self._chunks = chunks
+        self._pending = b""
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._finished:
+            try:
+                self._pending = from_thread.run(self._chunks.__anext__)
+            except StopAsyncIteration:
+                self._finished = True
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
@@ -0,0 +1,94 @@
+"""
+Command line tool to import articles in bulk from an NDJSON or CSV file.
+
+Usage:
+    python import_articles.py articles.ndjson --checkpoint import.ckpt --reject-file rejects.ndjson
+"""
+
+import argparse
+import os
+import sys
+from config.database import init_database
+from config.settings import get_settings
+from services.article_import_service import DEFAULT_CHUNK_SIZE, ArticleImportService
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        argv (list, optional): Arguments to parse instead of ``sys.argv``.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Import articles from NDJSON or CSV.")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=["ndjson", "csv"], dest="file_format")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--checkpoint", help="File used to resume an interrupted import")
+    parser.add_argument("--reject-file", help="NDJSON file receiving the rejected rows")
+    return parser.parse_args(argv)
+
+
+def report_progress(summary):
+    """
+    Print the progress of the import on stderr.
+
+    Args:
+        summary (ImportSummary): The current import counters.
+    """
+    print(
+        f"\rprocessed={summary.processed} inserted={summary.inserted} "
+        f"rejected={summary.rejected} rows/s={summary.rows_per_second:.0f}",
+        end="",
+        file=sys.stderr,
+    )
+
+
+def main(argv=None) -> int:
+    """
+    Run the import.
+
+    Args:
+        argv (list, optional): Arguments to parse instead of ``sys.argv``.
+
+    Returns:
+        int: The process exit code, 1 if any row was rejected, 2 if the
+        import could not complete.
+    """
+    args = parse_args(argv)
+    init_database(get_settings())
+    file_format = args.file_format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    # pylint: disable=consider-using-with
+    reject_stream = open(args.reject_file, "a", encoding="utf-8") if args.reject_file else None
+    source = {"path": os.path.abspath(args.path), "size": os.path.getsize(args.path)}
+    try:
+        with open(args.path, "rb") as stream:
+            summary = ArticleImportService(
+                chunk_size=args.chunk_size,
+                checkpoint_path=args.checkpoint,
+                reject_stream=reject_stream,
+                progress=report_progress,
+            ).import_stream(stream, file_format, source=source)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    finally:
+        if reject_stream is not None:
+            reject_stream.close()
+    print(file=sys.stderr)
+    print(
+        f"Imported {summary.inserted} articles, rejected {summary.rejected}, "
+        f"skipped {summary.skipped} in {summary.elapsed:.2f}s "
+        f"({summary.rows_per_second:.0f} rows/s)"
+    )
+    if summary.error:
+        print(f"Import stopped: {summary.error}", file=sys.stderr)
+        return 2
+    return 1 if summary.rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,46 +1,116 @@
 """ FastAPI """
 
+import logging
+import threading
+import time
 from contextlib import asynccontextmanager
+from typing import Optional
+import anyio
+from anyio import to_thread
 from fastapi import FastAPI, Depends
 from starlette.responses import RedirectResponse
-from helpers.api_key_auth import get_api_key
+from helpers.api_key_auth import get_api_key, load_api_keys
+from helpers.rate_limit import build_rate_limiter
 from routes.author_route import author_router
 from routes.article_route import article_route
+from config.database import init_database
 from config.database import database as connection  # type: ignore
+from config.settings import Settings, get_settings
+from services.article_write_behind import build_write_behind
+from services.author_service import AuthorIdCache
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def _open_connection(barrier: threading.Barrier):
+    try:
+        connection.connect(reuse_if_open=True)
+        connection.execute_sql("SELECT 1")
+    except Exception:
+        barrier.abort()
+        raise
+    # Keep this thread busy until every warm-up connection is open, so that
+    # each one is opened by a different threadpool thread.
+    barrier.wait()
+
+
+async def warm_up(fastapi_app: FastAPI):
+    """
+    Open database connections in the threadpool and fill the caches used by
+    the first requests: the author id cache of the bulk imports and the
+    OpenAPI schema served by /docs.
+
+    Peewee keeps one connection per thread and anyio retires threadpool
+    threads idle for 10 seconds, so the connections opened here serve the
+    requests arriving right after startup, not later bursts.
+
+    Args:
+        fastapi_app (FastAPI): The FastAPI application.
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    count = max(
+        1, min(fastapi_app.state.settings.warm_up_connections, int(limiter.total_tokens))
+    )
+    barrier = threading.Barrier(count, timeout=10)
+    async with anyio.create_task_group() as group:
+        for _ in range(count):
+            group.start_soon(to_thread.run_sync, _open_connection, barrier)
+    authors = await to_thread.run_sync(fastapi_app.state.author_cache.load)
+    fastapi_app.openapi()
+    logger.info("Warm-up opened %d connections and cached %d author ids", count, authors)
 
 
 @asynccontextmanager
-async def manage_lifespan(_app: FastAPI):
+async def manage_lifespan(fastapi_app: FastAPI):
     """
     Manage the lifespan of the FastAPI application.
 
+    Peewee opens one connection per thread, so when the process has a
+    connection budget the threadpool running the routes is capped to it,
+    keeping one connection for this thread and one for write-behind batching.
+    Startup fails if the budget leaves no connection for the threadpool.
+
     Args:
-        _app (FastAPI): The FastAPI application.
+        fastapi_app (FastAPI): The FastAPI application.
 
     Yields:
         None
     """
+    started = time.perf_counter()
+    settings = fastapi_app.state.settings
+    write_behind = fastapi_app.state.write_behind
+    if settings.db_connections_per_worker:
+        if settings.db_connections_per_worker < settings.db_connections_required:
+            raise RuntimeError(
+                f"DB_CONNECTIONS_PER_WORKER={settings.db_connections_per_worker} is too low: "
+                f"each server process needs {settings.db_connections_required} connections"
+            )
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = (
+            settings.db_connections_per_worker - settings.db_connections_required + 1
+        )
     if connection.is_closed():
         connection.connect()
+    if settings.warm_up:
+        await warm_up(fastapi_app)
+    fastapi_app.state.startup_seconds = time.perf_counter() - started
+    logger.info(
+        "Application created in %.3fs, started in %.3fs%s",
+        fastapi_app.state.create_seconds,
+        fastapi_app.state.startup_seconds,
+        " (with warm-up)" if settings.warm_up else "",
+    )
     try:
         yield
     finally:
+        if write_behind is not None:
+            await to_thread.run_sync(
+                write_behind.close, settings.article_write_behind_drain_timeout
+            )
         if not connection.is_closed():
             connection.close()
 
 
-app = FastAPI(
-    title="Implementación de Pylint y PEP8",
-    version="2.0",
-    contact={
-        "name": "Mariana and Alejandro",
-        "url": "https://github.com/Mariana1010P/ImplementacionPylintBlack",
-    },
-    lifespan=manage_lifespan,
-)
-
-
-@app.get("/")
 def read_root():
     """
     Redirects to the Swagger UI documentation.
@@ -48,16 +118,57 @@ def read_root():
     return RedirectResponse(url="/docs")
 
 
-app.include_router(
-    author_router,
-    prefix="/authors",
-    tags=["authors"],
-    dependencies=[Depends(get_api_key)],
-)
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    The API key registry, the rate limiter, the write-behind queue and the
+    author id cache are stored on ``app.state``. The database is bound here,
+    but no connection is opened until the application starts. Peewee models
+    are bound process-wide, so the last application created owns the database.
+
+    Serve it with ``gunicorn "main:create_app()"`` or ``uvicorn --factory main:create_app``.
+
+    Args:
+        settings (Settings, optional): The settings to use. Loaded from the
+            environment when omitted.
+
+    Returns:
+        FastAPI: The application.
+    """
+    started = time.perf_counter()
+    settings = settings or get_settings()
+    init_database(settings)
+
+    fastapi_app = FastAPI(
+        title="Implementación de Pylint y PEP8",
+        version="2.0",
+        contact={
+            "name": "Mariana and Alejandro",
+            "url": "https://github.com/Mariana1010P/ImplementacionPylintBlack",
+        },
+        lifespan=manage_lifespan,
+    )
+    fastapi_app.state.settings = settings
+    fastapi_app.state.api_key_registry = load_api_keys(settings)
+    fastapi_app.state.rate_limiter = build_rate_limiter(settings.rate_limit_redis_url)
+    fastapi_app.state.write_behind = build_write_behind(settings)
+    fastapi_app.state.author_cache = AuthorIdCache()
+
+    fastapi_app.add_api_route("/", read_root, methods=["GET"])
+
+    fastapi_app.include_router(
+        author_router,
+        prefix="/authors",
+        tags=["authors"],
+        dependencies=[Depends(get_api_key)],
+    )
 
-app.include_router(
-    article_route,
-    prefix="/articles",
-    tags=["articles"],
-    dependencies=[Depends(get_api_key)],
-)
+    fastapi_app.include_router(
+        article_route,
+        prefix="/articles",
+        tags=["articles"],
+        dependencies=[Depends(get_api_key)],
+    )
+    fastapi_app.state.create_seconds = time.perf_counter() - started
+    return fastapi_app
@@ -1,9 +1,14 @@
 """ article_route.py """
 
-from fastapi import APIRouter, Body, HTTPException
+import io
+from typing import Optional
+from fastapi import APIRouter, Body, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from peewee import DoesNotExist, IntegrityError
+from helpers.request_body import RequestBodyReader
 from schemas.article import Article
 from services.article_service import ArticleService
+from services.article_import_service import ArticleImportService
 
 article_route = APIRouter()
 
@@ -43,11 +48,15 @@ def get_article_by_id(article_id: int):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 @article_route.post("/articles")
-def create_article(article: Article = Body(...)):
+async def create_article(request: Request, article: Article = Body(...)):
     """
     Creates a new article.
 
+    With write-behind batching enabled the article is inserted together with
+    other pending articles; otherwise it is inserted in the threadpool.
+
     Args:
+        request (Request): The incoming request, giving access to the write-behind queue.
         title (str): The title of the article.
         content (str): The content of the article.
         author_id_article (int): The author ID associated with the article.
@@ -56,19 +65,75 @@ def create_article(article: Article = Body(...)):
     Returns:
         ArticleModel: The created article.
     """
+    fields = {
+        "title": article.title,
+        "author_id_article": article.author_id_article,
+        "content": article.content,
+        "published_date": article.published_date,
+    }
     try:
-        article_instance = ArticleService.create_article(
-            title=article.title,
-            author_id_article=article.author_id_article,
-            content=article.content,
-            published_date=article.published_date
-        )
+        write_behind = request.app.state.write_behind
+        if write_behind is not None:
+            article_instance = await write_behind.create(fields)
+        else:
+            article_instance = await run_in_threadpool(ArticleService.create_article, **fields)
         return {"message": "Article created", "article": article_instance}
     except IntegrityError as exc:
         raise HTTPException(status_code=400, detail=f"Integrity error: {str(exc)}") from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+_IMPORT_BODY = {"schema": {"type": "string", "format": "binary"}}
+
+@article_route.post(
+    "/articles/import",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": _IMPORT_BODY, "text/csv": _IMPORT_BODY},
+        }
+    },
+)
+async def import_articles(
+    request: Request,
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+):
+    """
+    Imports articles in bulk from an NDJSON or CSV request body.
+
+    The body is parsed while it is being received, in the threadpool, so
+    the upload is never buffered whole.
+
+    Args:
+        request (Request): The incoming request, carrying the file as its body.
+        file_format (str, optional): "ndjson" or "csv". Inferred from the
+            Content-Type header when omitted.
+
+    Returns:
+        dict: Counters describing the import and the first rejected rows.
+
+    Raises:
+        HTTPException: 400 with the partial summary if a line is not valid
+            UTF-8; the rows before it are already imported.
+    """
+    if file_format is None:
+        content_type = request.headers.get("content-type", "")
+        file_format = "csv" if content_type.startswith("text/csv") else "ndjson"
+    stream = io.BufferedReader(RequestBodyReader(request.stream()))
+    try:
+        import_service = ArticleImportService(author_cache=request.app.state.author_cache)
+        summary = await run_in_threadpool(import_service.import_stream, stream, file_format)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    if summary.error:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": summary.error, "summary": summary.as_dict()},
+        )
+    return {"message": "Articles imported", "summary": summary.as_dict()}
+
 @article_route.put("/articles/{article_id}", response_model=Article)
 def update_article(article_id: int, article_data: Article = Body(...)):
     """
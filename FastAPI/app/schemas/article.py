@@ -1,11 +1,12 @@
 """
 schemas/article.py
 
-This module defines the Pydantic model for an Article.
+This module defines the Pydantic models for an Article.
 """
 
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Optional
+from pydantic import BaseModel, Field
 
 class Article(BaseModel):
     """
@@ -24,3 +25,20 @@ class Article(BaseModel):
     content: str
     author_id_article: int  
     published_date: datetime
+
+
+class ArticleImportRow(BaseModel):
+    """
+    Schema representing one row of a bulk article import.
+
+    Attributes:
+        title (str): Title of the article.
+        content (str): Content of the article.
+        author_id_article (int): Author of the article, foreign key extending to author.
+        published_date (datetime, optional): Date when the article was published.
+    """
+
+    title: str = Field(max_length=255)
+    content: str
+    author_id_article: int
+    published_date: Optional[datetime] = None
@@ -0,0 +1,279 @@
+"""
+Module that provides bulk import of articles from NDJSON or CSV streams.
+
+Rows are parsed one at a time, validated against ``ArticleImportRow`` and
+inserted in chunks with ``insert_many``, each chunk in its own transaction.
+Rejected rows and then the checkpoint are written once their chunk is
+committed. Resuming is at-least-once: if the process dies after a commit but
+before the checkpoint file is replaced, that chunk is inserted again and its
+rejects are written twice. Other interruptions resume without duplicates.
+"""
+
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, TextIO
+from peewee import IntegrityError
+from pydantic import ValidationError
+from config.database import ArticleModel, database
+from schemas.article import ArticleImportRow
+from services.author_service import AuthorIdCache
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# pylint: disable=no-value-for-parameter
+
+
+@dataclass
+class ImportSummary:
+    """
+    Result of a bulk import.
+
+    Attributes:
+        processed (int): Rows read from the input, including skipped ones.
+        inserted (int): Rows inserted in the database.
+        rejected (int): Rows that failed validation or insertion.
+        skipped (int): Rows skipped because a checkpoint marked them as done.
+        elapsed (float): Seconds spent importing.
+        rejects (list): First rejected rows, capped at ``max_rejects``.
+        error (str, optional): Why the import stopped before the end of the input.
+    """
+
+    processed: int = 0
+    inserted: int = 0
+    rejected: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    rejects: list = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Returns:
+            float: Inserted rows per second.
+        """
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        """
+        Returns:
+            dict: The summary as a JSON serialisable dictionary.
+        """
+        return {
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "rejected": self.rejected,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "rejects": self.rejects,
+            "error": self.error,
+        }
+
+
+def iter_ndjson(lines: Iterable[str]) -> Iterator[tuple]:
+    """
+    Iterate over the records of an NDJSON stream.
+
+    Args:
+        lines (Iterable[str]): The lines to read.
+
+    Yields:
+        tuple: ``(line_number, record)`` pairs. ``record`` is the raw line
+        when it is not valid JSON.
+    """
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError:
+            yield number, line
+
+
+def iter_csv(lines: Iterable[str]) -> Iterator[tuple]:
+    """
+    Iterate over the records of a CSV stream with a header row.
+
+    Empty cells are returned as ``None``.
+
+    Args:
+        lines (Iterable[str]): The lines to read.
+
+    Yields:
+        tuple: ``(line_number, record)`` pairs.
+    """
+    reader = csv.DictReader(lines)
+    for record in reader:
+        yield reader.line_num, {key: value or None for key, value in record.items()}
+
+
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
+class ArticleImportService:
+    """
+    Service class for importing articles in bulk.
+
+    Authors referenced by the rows are resolved through an ``AuthorIdCache``,
+    which the application shares between imports.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checkpoint_path: Optional[str] = None,
+        reject_stream: Optional[TextIO] = None,
+        progress: Optional[Callable[[ImportSummary], None]] = None,
+        max_rejects: int = 100,
+        author_cache: Optional[AuthorIdCache] = None,
+    ):
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.reject_stream = reject_stream
+        self.progress = progress
+        self.max_rejects = max_rejects
+        self.author_cache = author_cache or AuthorIdCache()
+        self._source = None
+        self._pending_rejects = []
+        self._lines_read = 0
+
+    def import_stream(
+        self, stream: BinaryIO, file_format: str, source: Optional[dict] = None
+    ) -> ImportSummary:
+        """
+        Import the articles contained in a UTF-8 encoded stream.
+
+        The stream is decoded one line at a time. If a line is not valid
+        UTF-8 the import stops there: the rows before it are committed and
+        ``ImportSummary.error`` names the line. The checkpoint is deleted once
+        the whole input has been imported.
+
+        Args:
+            stream (BinaryIO): The NDJSON or CSV byte stream.
+            file_format (str): Either ``"ndjson"`` or ``"csv"``.
+            source (dict, optional): Identity of the input, such as its path
+                and size, stored in the checkpoint.
+
+        Returns:
+            ImportSummary: Counters describing the import.
+
+        Raises:
+            ValueError: If the format is not supported or the checkpoint was
+                written for another input.
+        """
+        if file_format == "ndjson":
+            records = iter_ndjson(self._decode_lines(stream))
+        elif file_format == "csv":
+            records = iter_csv(self._decode_lines(stream))
+        else:
+            raise ValueError(f"Unsupported import format: {file_format}")
+
+        self._source = source or {}
+        summary = ImportSummary()
+        resume_from = self._read_checkpoint()
+        started = time.perf_counter()
+        chunk = []
+        try:
+            for number, record in records:
+                summary.processed += 1
+                if summary.processed <= resume_from:
+                    summary.skipped += 1
+                    continue
+                row = self._validate(number, record, summary)
+                if row is not None:
+                    chunk.append((number, row))
+                if len(chunk) >= self.chunk_size:
+                    self._flush(chunk, summary, started)
+                    chunk = []
+        except UnicodeDecodeError as exc:
+            summary.error = f"Invalid UTF-8 on line {self._lines_read + 1}: {exc.reason}"
+        self._flush(chunk, summary, started)
+        if summary.error is None:
+            self._clear_checkpoint()
+        return summary
+
+    def _decode_lines(self, stream: BinaryIO) -> Iterator[str]:
+        # Lines are split on b"\n" before decoding, so that JSON strings may
+        # contain other Unicode line separators such as U+2028.
+        self._lines_read = 0
+        for line in stream:
+            text = line.decode("utf-8")
+            self._lines_read += 1
+            yield text
+
+    def _validate(self, number: int, record, summary: ImportSummary) -> Optional[dict]:
+        if not isinstance(record, dict):
+            self._reject(number, record, "Row is not a JSON object", summary)
+            return None
+        try:
+            row = ArticleImportRow.model_validate(record).model_dump()
+        except ValidationError as exc:
+            self._reject(number, record, str(exc), summary)
+            return None
+        if not self.author_cache.exists(row["author_id_article"]):
+            self._reject(number, record, f"Author {row['author_id_article']} not found", summary)
+            return None
+        return row
+
+    def _flush(self, chunk: list, summary: ImportSummary, started: float):
+        if chunk:
+            try:
+                with database.atomic():
+                    ArticleModel.insert_many([row for _, row in chunk]).execute()
+                summary.inserted += len(chunk)
+            except IntegrityError:
+                self._insert_one_by_one(chunk, summary)
+        if self.reject_stream is not None and self._pending_rejects:
+            for reject in self._pending_rejects:
+                self.reject_stream.write(json.dumps(reject, default=str) + "\n")
+            self.reject_stream.flush()
+        self._pending_rejects = []
+        summary.elapsed = time.perf_counter() - started
+        self._write_checkpoint(summary.processed)
+        if self.progress:
+            self.progress(summary)
+
+    def _insert_one_by_one(self, chunk: list, summary: ImportSummary):
+        for number, row in chunk:
+            try:
+                with database.atomic():
+                    ArticleModel.insert(row).execute()
+                summary.inserted += 1
+            except IntegrityError as exc:
+                self._reject(number, row, f"Integrity error: {exc}", summary)
+
+    def _reject(self, number: int, record, error: str, summary: ImportSummary):
+        summary.rejected += 1
+        reject = {"row": number, "error": error, "data": record}
+        if len(summary.rejects) < self.max_rejects:
+            summary.rejects.append(reject)
+        if self.reject_stream is not None:
+            self._pending_rejects.append(reject)
+
+    def _read_checkpoint(self) -> int:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return 0
+        with open(self.checkpoint_path, encoding="utf-8") as checkpoint:
+            data = json.load(checkpoint)
+        if data.get("source", {}) != self._source:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to another input: {data.get('source')}"
+            )
+        return int(data.get("processed", 0))
+
+    def _write_checkpoint(self, processed: int):
+        if not self.checkpoint_path:
+            return
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as checkpoint:
+            json.dump({"source": self._source, "processed": processed}, checkpoint)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
@@ -0,0 +1,263 @@
+"""
+Module that provides write-behind batching (group commit) for article creation.
+
+When ``ARTICLE_WRITE_BEHIND`` is enabled, the article creation route puts
+each article on an in-process queue instead of inserting it directly.
+A background thread flushes the queue with one multi-row INSERT per batch,
+once ``ARTICLE_BATCH_SIZE`` articles are waiting or ``ARTICLE_BATCH_MAX_DELAY_MS``
+milliseconds have passed since the first one arrived.
+
+Durability is selected with ``ARTICLE_WRITE_BEHIND_DURABILITY``:
+
+- ``commit`` (default): the caller awaits the commit of its batch and
+  receives the generated id. Waiting callers do not hold a threadpool
+  thread, so batches can grow beyond the size of the threadpool.
+- ``enqueue``: the caller returns as soon as the article is queued, without
+  an id. Articles still queued when the process dies are lost.
+
+On MySQL the ids of a batch are derived from the first generated id. This is
+only correct when the ids of a multi-row INSERT are consecutive, that is with
+``innodb_autoinc_lock_mode`` 0 or 1 and ``auto_increment_increment`` 1. The
+writer thread checks both when it starts; otherwise, in ``commit`` mode, it
+inserts the rows of each batch one at a time, still in a single transaction.
+Other databases must support ``RETURNING``.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+from anyio import to_thread
+from peewee import IntegrityError, MySQLDatabase
+from config.database import ArticleModel, database
+from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# pylint: disable=no-value-for-parameter
+
+_STOP = object()
+
+
+# pylint: disable=too-many-instance-attributes
+class ArticleWriteBehind:
+    """
+    Queue of pending article inserts flushed in batches by a background thread.
+
+    Attributes:
+        batch_size (int): Maximum number of articles per INSERT.
+        max_delay (float): Seconds to wait for a batch to fill up.
+        durability (str): Either ``"commit"`` or ``"enqueue"``.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        max_delay_ms: float = 10.0,
+        queue_size: int = 10000,
+        durability: str = "commit",
+    ):
+        if durability not in ("commit", "enqueue"):
+            raise ValueError(f"Invalid write-behind durability: {durability}")
+        self.batch_size = batch_size
+        self.max_delay = max_delay_ms / 1000
+        self.durability = durability
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._consecutive_ids = False
+
+    async def create(self, fields: dict) -> ArticleModel:
+        """
+        Queue an article for insertion.
+
+        Args:
+            fields (dict): The article fields.
+
+        Returns:
+            ArticleModel: The article, with its generated id when durability
+            is ``"commit"``.
+
+        Raises:
+            ValueError: If the insert fails or the queue has been closed.
+        """
+        # The queue is bounded, so putting may block until the writer catches up.
+        future = await to_thread.run_sync(self.submit, fields)
+        if self.durability == "enqueue":
+            return ArticleModel(**fields)
+        return await asyncio.wrap_future(future)
+
+    def submit(self, fields: dict) -> Future:
+        """
+        Queue an article for insertion, blocking while the queue is full.
+
+        Args:
+            fields (dict): The article fields.
+
+        Returns:
+            Future: Resolved with the inserted ArticleModel once its batch commits.
+
+        Raises:
+            ValueError: If the queue has been closed.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise ValueError("Failed to create article: write-behind queue is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="article-write-behind", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((fields, future))
+        if self._closed and not self._thread.is_alive():
+            # Closed while this article was being queued: nobody will flush it.
+            self._drain()
+        return future
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Stop accepting articles and flush the ones still queued.
+
+        Articles still queued when the timeout expires are failed.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the queue to drain,
+                in total.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if thread is not None:
+            try:
+                self._queue.put(_STOP, timeout=self._remaining(deadline))
+            except queue.Full:
+                pass
+            thread.join(self._remaining(deadline))
+        self._drain()
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    def _drain(self):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._fail([item], RuntimeError("write-behind queue is closed"))
+
+    def _run(self):
+        if self.durability == "commit" and isinstance(database.obj, MySQLDatabase):
+            self._consecutive_ids = self._check_consecutive_ids()
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+        if not database.is_closed():
+            database.close()
+
+    def _flush(self, batch: list):
+        try:
+            with database.atomic():
+                article_ids = self._insert_batch([fields for fields, _ in batch])
+        except IntegrityError:
+            self._insert_one_by_one(batch)
+            return
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._fail(batch, exc)
+            return
+        for (fields, future), article_id in zip(batch, article_ids):
+            future.set_result(ArticleModel(article_id=article_id, **fields))
+
+    @staticmethod
+    def _check_consecutive_ids() -> bool:
+        try:
+            lock_mode, increment = database.execute_sql(
+                "SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment"
+            ).fetchone()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Inserting write-behind batches row by row: %s", exc)
+            return False
+        if int(lock_mode) <= 1 and int(increment) == 1:
+            return True
+        logger.warning(
+            "Inserting write-behind batches row by row: innodb_autoinc_lock_mode=%s and "
+            "auto_increment_increment=%s do not guarantee consecutive ids",
+            lock_mode,
+            increment,
+        )
+        return False
+
+    def _insert_batch(self, rows: list) -> list:
+        if not isinstance(database.obj, MySQLDatabase):
+            query = ArticleModel.insert_many(rows).returning(ArticleModel.article_id)
+            return [row[0] for row in query.tuples().execute()]
+        if self.durability == "enqueue":
+            # Nobody receives the ids.
+            ArticleModel.insert_many(rows).execute()
+            return [None] * len(rows)
+        if self._consecutive_ids:
+            first_id = ArticleModel.insert_many(rows).execute()
+            return list(range(first_id, first_id + len(rows)))
+        return [ArticleModel.insert(row).execute() for row in rows]
+
+    def _insert_one_by_one(self, batch: list):
+        for fields, future in batch:
+            try:
+                with database.atomic():
+                    article_id = ArticleModel.insert(fields).execute()
+                future.set_result(ArticleModel(article_id=article_id, **fields))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._fail([(fields, future)], exc)
+
+    def _fail(self, batch: list, exc: Exception):
+        error = ValueError(f"Failed to create article: {exc}")
+        for fields, future in batch:
+            if self.durability == "enqueue":
+                logger.error("Dropped queued article %r: %s", fields.get("title"), exc)
+            if not future.done():
+                future.set_exception(error)
+
+
+def build_write_behind(settings: Settings) -> Optional[ArticleWriteBehind]:
+    """
+    Build the write-behind queue described by the settings.
+
+    Args:
+        settings (Settings): The application settings.
+
+    Returns:
+        ArticleWriteBehind: The queue, or None if batching is disabled.
+    """
+    if not settings.article_write_behind:
+        return None
+    return ArticleWriteBehind(
+        batch_size=settings.article_batch_size,
+        max_delay_ms=settings.article_batch_max_delay_ms,
+        queue_size=settings.article_queue_size,
+        durability=settings.article_write_behind_durability,
+    )
@@ -2,6 +2,7 @@
 Module that provides service functionality for managing authors in the database.
 """
 
+import threading
 from peewee import DoesNotExist, IntegrityError  # type: ignore
 from config.database import AuthorModel
 
@@ -130,3 +131,52 @@ class AuthorService:
             return list(AuthorModel.select())
         except Exception as exc:
             raise RuntimeError(f"Error al obtener autores: {exc}") from exc
+
+
+class AuthorIdCache:
+    """
+    In-memory set of existing author ids, shared by the bulk imports of a
+    process so that author foreign keys are resolved without a query per row.
+
+    Ids missing from the cache are looked up in the database and added when
+    found. Authors deleted after being cached are still reported as existing;
+    the insert then fails on the foreign key and the row is rejected.
+    """
+
+    def __init__(self):
+        self._ids = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """
+        Load every author id from the database.
+
+        Returns:
+            int: The number of cached ids.
+        """
+        ids = {author.author_id for author in AuthorModel.select(AuthorModel.author_id)}
+        with self._lock:
+            self._ids |= ids
+            self._loaded = True
+            return len(self._ids)
+
+    def exists(self, author_id: int) -> bool:
+        """
+        Check whether an author exists.
+
+        Args:
+            author_id (int): The ID of the author.
+
+        Returns:
+            bool: True if the author exists.
+        """
+        if not self._loaded:
+            self.load()
+        if author_id in self._ids:
+            return True
+        if AuthorModel.select().where(AuthorModel.author_id == author_id).exists():
+            with self._lock:
+                self._ids.add(author_id)
+            return True
+        return False
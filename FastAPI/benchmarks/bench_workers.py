@@ -0,0 +1,119 @@
+"""
+bench_workers.py
+
+Measure the requests per second served by gunicorn for several worker
+counts, against the SQLite stand-in database of ``standin_app.py``.
+
+Usage, from the FastAPI directory:
+    python benchmarks/bench_workers.py --workers 1 2 4 --duration 10 --clients 16
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+API_KEY = "benchmark"
+PORT = 8765
+
+
+def wait_until_ready(timeout: float = 30) -> float:
+    """
+    Wait until the server answers.
+
+    Returns:
+        float: Seconds waited.
+    """
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", PORT, timeout=1)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return time.perf_counter() - started
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("Server did not start")
+
+
+def client(deadline: float, results):
+    """
+    Send requests on one keep-alive connection until the deadline.
+    """
+    connection = http.client.HTTPConnection("127.0.0.1", PORT, timeout=10)
+    done = 0
+    while time.time() < deadline:
+        connection.request(
+            "GET", f"/articles/articles/{done % 1000 + 1}", headers={"x-api-key": API_KEY}
+        )
+        response = connection.getresponse()
+        response.read()
+        if response.status == 200:
+            done += 1
+    results.put(done)
+
+
+def run(workers: int, duration: float, clients: int) -> tuple:
+    """
+    Benchmark one worker count.
+
+    Returns:
+        tuple: Startup seconds and requests per second.
+    """
+    env = dict(
+        os.environ,
+        WEB_CONCURRENCY=str(workers),
+        PORT=str(PORT),
+        API_KEY=API_KEY,
+        RATE_LIMIT_RATE="1000000",
+        RATE_LIMIT_BURST="1000000",
+        PYTHONPATH=os.pathsep.join([APP_DIR, BENCH_DIR]),
+    )
+    server = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "standin_app:app"],
+        cwd=APP_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        startup = wait_until_ready()
+        results = multiprocessing.Queue()
+        deadline = time.time() + duration
+        processes = [
+            multiprocessing.Process(target=client, args=(deadline, results)) for _ in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        total = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        return startup, total / duration
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    """
+    Run the benchmark for every requested worker count and print a table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--clients", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'startup s':>10} {'req/s':>10}")
+    for workers in args.workers:
+        startup, rps = run(workers, args.duration, args.clients)
+        print(f"{workers:>8} {startup:>10.2f} {rps:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
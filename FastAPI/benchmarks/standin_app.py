@@ -0,0 +1,33 @@
+"""
+standin_app.py
+
+The API bound to a local SQLite database instead of MySQL, used by the
+benchmarks. The database file is created and seeded on import, so with
+``preload_app`` it is prepared once in the gunicorn master.
+"""
+
+import dataclasses
+import os
+from config.database import ArticleModel, AuthorModel, database
+from config.settings import get_settings
+from main import create_app
+
+# pylint: disable=no-value-for-parameter
+
+STANDIN_DATABASE = os.getenv("STANDIN_DATABASE", "/tmp/standin.db")
+
+app = create_app(
+    dataclasses.replace(get_settings(), database_url=f"sqlite:///{STANDIN_DATABASE}")
+)
+
+with database.connection_context():
+    database.pragma("journal_mode", "wal", permanent=True)
+    database.create_tables([AuthorModel, ArticleModel])
+    if not AuthorModel.select().exists():
+        author = AuthorModel.create(name="Benchmark", affiliation="Local")
+        ArticleModel.insert_many(
+            [
+                {"title": f"Article {i}", "content": "Lorem ipsum", "author_id_article": author}
+                for i in range(1000)
+            ]
+        ).execute()